@@ -8,21 +8,76 @@
 
 # If extensions (or modules to document with autodoc) are in another directory,
 # add these directories to sys.path here. If the directory is relative to the
-# documentation root, use os.path.abspath to make it absolute, like shown here.
+# documentation root, resolve it relative to this file, like shown here.
+import hashlib
 import os
-import subprocess
+import re
 import sys
+from pathlib import Path
 
-from natsort import natsorted
+HERE = Path(__file__).resolve()
+repodir = str(HERE.parents[2])
+gitdir = str(HERE.parents[2] / ".git")
 
-sys.path.insert(0, os.path.abspath("../../"))
+sys.path.insert(0, repodir)
 
-repodir = os.path.abspath(os.path.join(__file__, r"../../.."))
-gitdir = os.path.join(repodir, r".git")
+# Oldest release to publish docs for. The tag whitelist only grows as new
+# releases are tagged, so sphinx-multiversion keeps the output it already
+# built for older versions. Bump this to drop old versions from the site.
+MIN_DOC_VERSION = (0, 1, 0)
+
+
+def _list_tags(gitdir, prefix="v"):
+    """Return the names of the tags that start with ``prefix``.
+
+    Reads the loose refs under ``refs/tags`` and the ``packed-refs`` file
+    directly so that importing conf.py does not need to spawn ``git``.
+    """
+    tags = set()
+    tags_dir = os.path.join(gitdir, "refs", "tags")
+    for root, _, files in os.walk(tags_dir):
+        for name in files:
+            tag = os.path.relpath(os.path.join(root, name), tags_dir).replace(os.sep, "/")
+            if tag.startswith(prefix):
+                tags.add(tag)
+
+    packed_refs = os.path.join(gitdir, "packed-refs")
+    if os.path.isfile(packed_refs):
+        with open(packed_refs, encoding="utf-8") as f:
+            for line in f:
+                # Skip the header and the peeled ("^<sha>") lines of annotated tags.
+                if line.startswith(("#", "^")):
+                    continue
+                _, _, ref = line.strip().partition(" ")
+                if ref.startswith("refs/tags/" + prefix):
+                    tags.add(ref[len("refs/tags/") :])
+    return list(tags)
+
+
+_NUM = re.compile(r"(\d+)")
+
+
+def _natural_key(tag):
+    return tuple(int(part) if part.isdigit() else part for part in _NUM.split(tag))
+
+
+def _parse_version(tag):
+    return tuple(int(part) for part in _NUM.findall(tag))
+
+
+def _tags_since(tags, min_version=MIN_DOC_VERSION):
+    """Return the tags at or above ``min_version`` in natural sort order."""
+    return sorted((t for t in tags if _parse_version(t) >= min_version), key=_natural_key)
 
 
 # -- Project information -----------------------------------------------------
 
+# Sphinx pickles the configuration into the environment in the doctree
+# directory, which CI caches between runs. Keep the values below free of
+# timestamps and of paths outside the repository so that the cached
+# environment stays valid.
+# Set SOURCE_DATE_EPOCH if a build needs a reproducible date.
+
 project = "Merlin Dataloader"
 copyright = "2022, NVIDIA"  # pylint: disable=W0622
 author = "NVIDIA"
@@ -37,28 +92,34 @@ extensions = [
     "myst_nb",
     "sphinx_multiversion",
     "sphinx_rtd_theme",
-    "sphinx.ext.autodoc",
-    "sphinx.ext.autosummary",
-    "sphinx.ext.coverage",
+    "autoapi.extension",
     "sphinx.ext.githubpages",
     "sphinx.ext.napoleon",
-    "sphinx.ext.viewcode",
     "sphinx.ext.intersphinx",
-    "sphinx_external_toc",
     "sphinxcontrib.copydirs",
 ]
 
-external_toc_path = "toc.yaml"
+# Source pages and the coverage report are slow to generate and not needed
+# for everyday builds. Set DOC_VIEWCODE=1 or DOC_COVERAGE=1 to enable them.
+if os.environ.get("DOC_VIEWCODE"):
+    extensions.append("sphinx.ext.viewcode")
+if os.environ.get("DOC_COVERAGE"):
+    extensions.append("sphinx.ext.coverage")
+
 myst_enable_extensions = [
     "deflist",
     "html_image",
-    "linkify",
     "replacements",
     "tasklist",
 ]
-myst_linkify_fuzzy_links = False
 myst_heading_anchors = 3
-jupyter_execute_notebooks = "off"
+# Execute notebooks only when they changed since their last run. The cache
+# is shared by local builds and CI, which restores it between runs.
+nb_execution_mode = "cache"
+nb_execution_cache_path = str(Path(repodir) / "docs" / "_jupyter_cache")
+# Names used by myst-nb < 0.14, which is what requirements/docs.txt pins.
+jupyter_execute_notebooks = nb_execution_mode
+jupyter_cache = nb_execution_cache_path
 
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ["_templates"]
@@ -66,10 +127,9 @@ templates_path = ["_templates"]
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
-exclude_patterns = []
+exclude_patterns = ["**/.ipynb_checkpoints", "**/node_modules", "**/__pycache__", "_build/**"]
 
-# The API documents are RST and include `.. toctree::` directives.
-suppress_warnings = ["etoc.toctree", "myst.hader", "misc.highlighting_failure"]
+suppress_warnings = ["myst.header", "misc.highlighting_failure"]
 
 # -- Options for HTML output -------------------------------------------------
 
@@ -93,16 +153,35 @@ html_static_path = ["_static"]
 # Determine if Sphinx is reading conf.py from the checked out
 # repo (a Git repo) vs SMV reading conf.py from an archive of the repo
 # at a commit (not a Git repo).
-if os.path.exists(gitdir):
-    tag_refs = subprocess.check_output(["git", "tag", "-l", "v*"]).decode("utf-8").split()
-    tag_refs = natsorted(tag_refs)[-6:]
-    smv_tag_whitelist = r"^(" + r"|".join(tag_refs) + r")$"
+# Jobs that never build other versions (linkcheck, spelling) can set
+# SPHINX_SKIP_SMV=1 to skip listing the tags altogether.
+if os.environ.get("SPHINX_SKIP_SMV"):
+    smv_tag_whitelist = r"^$"
+elif os.path.exists(gitdir):
+    if os.path.isdir(gitdir):
+        tag_refs = _tags_since(_list_tags(gitdir))
+    else:
+        # A worktree or submodule checkout, where .git is a file pointing elsewhere.
+        import subprocess
+
+        tag_refs = (
+            subprocess.check_output(
+                ["git", "for-each-ref", "--format=%(refname:strip=2)", "refs/tags/v*"],
+                cwd=repodir,
+            )
+            .decode("utf-8")
+            .split()
+        )
+        tag_refs = _tags_since(tag_refs)
+    # Deduplicate and escape the tags so the pattern only depends on the tag set.
+    tag_refs = sorted(set(tag_refs), key=_natural_key)
+    smv_tag_whitelist = r"^(?:" + r"|".join(map(re.escape, tag_refs)) + r")$"
 else:
     # SMV is reading conf.py from a Git archive of the repo at a specific commit.
     smv_tag_whitelist = r"^v.*$"
 
 # Only include main branch for now
-smv_branch_whitelist = "^main$"
+smv_branch_whitelist = r"^$" if os.environ.get("SPHINX_SKIP_SMV") else "^main$"
 
 smv_refs_override_suffix = r"-docs"
 
@@ -124,15 +203,20 @@ source_suffix = [".rst", ".md"]
 
 nbsphinx_allow_errors = True
 
-autodoc_inherit_docstrings = False
-autodoc_default_options = {
-    "members": True,
-    "undoc-members": True,
-    "show-inheritance": False,
-    "member-order": "bysource",
-}
+# sphinx-autoapi parses the sources statically, so building the API docs
+# does not import merlin.loader or the frameworks it depends on.
+autoapi_type = "python"
+autoapi_dirs = ["../../merlin"]
+autoapi_python_use_implicit_namespaces = True
+autoapi_ignore = ["*/utils/*", "*/_version.py"]
+# Only document members that have docstrings, which keeps autoapi from
+# generating entries for every undocumented helper and attribute.
+autoapi_options = ["members"]
+autoapi_member_order = "bysource"
+autoapi_add_toctree_entry = False
+autoapi_keep_files = True
 
-autosummary_generate = True
+nitpicky = False
 
 copydirs_additional_dirs = [
     "../../README.md",
@@ -141,3 +225,44 @@ copydirs_additional_dirs = [
 copydirs_file_rename = {
     "README.md": "index.md",
 }
+
+
+def _file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _snapshot_copied_files():
+    """Record the digest and mtime of the files that copydirs overwrites.
+
+    conf.py is executed before any extension is loaded, so this sees the
+    files as they were left by the previous build.
+    """
+    srcdir = str(HERE.parent)
+    snapshot = {}
+    for src in copydirs_additional_dirs:
+        name = os.path.basename(src)
+        for dest_name in dict.fromkeys((name, copydirs_file_rename.get(name, name))):
+            dest = os.path.join(srcdir, dest_name)
+            if os.path.isfile(dest):
+                snapshot[dest] = (_file_digest(dest), os.stat(dest).st_mtime_ns)
+    return snapshot
+
+
+_copied_files = _snapshot_copied_files()
+
+
+def _restore_unchanged_mtimes(app):
+    # copydirs rewrites its targets on every build. Put the old mtime back
+    # when the content did not change so Sphinx doesn't re-read those pages.
+    for dest, (digest, mtime_ns) in _copied_files.items():
+        if not os.path.isfile(dest):
+            continue
+        st = os.stat(dest)
+        if st.st_mtime_ns != mtime_ns and _file_digest(dest) == digest:
+            os.utime(dest, ns=(st.st_atime_ns, mtime_ns))
+
+
+def setup(app):
+    # Run after the copydirs handlers have copied the files.
+    app.connect("builder-inited", _restore_unchanged_mtimes, priority=900)
@@ -54,6 +54,14 @@ class Loader(LoaderBase):
         Whether or not to drop the last batch in an epoch. This is useful when you need to
         guarantee that each batch contains exactly `batch_size` rows - since the last batch
         will usually contain fewer rows.
+    num_workers: int, default 1
+        Number of background threads loading chunks. Each thread reads a disjoint
+        subset of the partitions, so with more than one worker the order in which
+        chunks arrive is no longer deterministic.
+    prefetch_factor: int, default 1
+        Number of chunks each worker may keep ready ahead of the training loop.
+        Above 1, each worker also reads and shuffles its next chunk while
+        the current one is being converted to tensors.
     """
 
     @contextlib.contextmanager
@@ -118,3 +126,6 @@ class Loader(LoaderBase):
 
     def _to_sparse_tensor(self, values_offset, column_name):
         raise NotImplementedError("Sparse support isn't implemented yet for the Jax dataloader")
+
+    def _to_sparse_tensors(self, X, column_names):
+        raise NotImplementedError("Sparse support isn't implemented yet for the Jax dataloader")
@@ -14,26 +14,21 @@
 # limitations under the License.
 #
 import copy
+import functools
 import math
-import queue
 import threading
 import warnings
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import numpy as np
 
-try:
-    import cupy as cp
-except ImportError:
-    cp = np
-
 from merlin.core.dispatch import (
     HAS_GPU,
     annotate,
     concat,
     generate_local_seed,
-    is_list_dtype,
     make_df,
     pull_apart_list,
 )
@@ -42,11 +37,74 @@ from merlin.dag.executors import LocalExecutor
 from merlin.io import shuffle_df
 from merlin.schema import Tags
 
+# put on the queue by the last loader worker once every chunk of the epoch is in
+_END_OF_EPOCH = object()
+
 
 def _num_steps(num_samples, step_size):
     return math.ceil(num_samples / step_size)
 
 
+@functools.lru_cache(maxsize=64)
+def _segment_lengths(num_samples, batch_size):
+    # chunks are nearly always the same size, so this is almost always a cache hit
+    num_full_batches = _num_steps(num_samples, batch_size) - 1
+    tail = num_samples - num_full_batches * batch_size
+    return (batch_size,) * num_full_batches + (tail,)
+
+
+_TRANSFORM_GRAPH_CACHE_SIZE = 32
+_transform_graph_cache = OrderedDict()
+_transform_graph_lock = threading.Lock()
+
+
+def _build_transform_graph(schema, transforms):
+    """Builds the transform graph for `schema`, returning its output node and
+    an executor. Loaders built from the same schema and list of transforms (one
+    per epoch or per worker in distributed training) share the compiled graph.
+    """
+    if isinstance(transforms, List):
+        for transform in transforms:
+            if not isinstance(transform, BaseOperator):
+                raise TypeError(
+                    f"Detected invalid transform, {type(transform)},"
+                    "we only support operators based on the merlin core"
+                    "`BaseOperator`"
+                )
+        ops = tuple(transforms)
+    elif isinstance(transforms, Graph):
+        # construct_schema updates a Graph's nodes in place, so build a private
+        # copy rather than reconfiguring nodes that other loaders still hold
+        graph = copy.deepcopy(transforms)
+        return graph.construct_schema(schema).output_node, LocalExecutor()
+    else:
+        raise TypeError(
+            f"Detected invalid transforms, {type(transforms)}, expected a list of "
+            "merlin core `BaseOperator`s or a merlin.dag `Graph`"
+        )
+
+    key = (id(schema), tuple(id(op) for op in ops))
+    with _transform_graph_lock:
+        cached = _transform_graph_cache.get(key)
+        # schemas can be modified in place, so check the columns still match
+        if cached is not None and cached[1] == schema.column_schemas:
+            _transform_graph_cache.move_to_end(key)
+            return cached[-1]
+
+    carry_node = Node(ColumnSelector("*"))
+    for transform in transforms:
+        carry_node = carry_node >> transform
+    result = (Graph(carry_node).construct_schema(schema).output_node, LocalExecutor())
+
+    with _transform_graph_lock:
+        # hold on to the schema and ops so their ids can't be reused while cached
+        _transform_graph_cache[key] = (schema, dict(schema.column_schemas), ops, result)
+        _transform_graph_cache.move_to_end(key)
+        if len(_transform_graph_cache) > _TRANSFORM_GRAPH_CACHE_SIZE:
+            _transform_graph_cache.popitem(last=False)
+    return result
+
+
 class LoaderBase:
     """Base class containing common functionality between the PyTorch and TensorFlow dataloaders."""
 
@@ -64,7 +122,14 @@ class LoaderBase:
         drop_last=False,
         transforms=None,
         device=None,
+        num_workers=1,
+        prefetch_factor=1,
     ):
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+        if prefetch_factor < 1:
+            raise ValueError(f"prefetch_factor must be at least 1, got {prefetch_factor}")
+
         self.dataset = dataset
         self.batch_size = batch_size
         self.shuffle = shuffle
@@ -73,8 +138,11 @@ class LoaderBase:
         self.global_size = global_size or 1
         self.global_rank = global_rank or 0
         self.drop_last = drop_last
+        self.num_workers = num_workers
+        self.prefetch_factor = prefetch_factor
 
-        self.indices = cp.arange(self.dataset.npartitions)
+        # partition indices are only ever consumed on the host, so keep them there
+        self.indices = np.arange(self.dataset.npartitions)
         if device:
             self.device = device
         else:
@@ -115,6 +183,27 @@ class LoaderBase:
                             " in the schema"
                         )
 
+        # The schema is fixed for the lifetime of the loader, so work out the
+        # layout of each dtype group and how it's turned into tensors once
+        # here. Changing `dataset.schema` afterwards requires building a new
+        # loader. Handlers are looked up on the class (not bound) so copies
+        # made by `epochs` don't call back into the original loader.
+        # list columns without a sparse_max entry are left as (values, offsets)
+        self._sparse_tensor_names = [name for name in self.sparse_names if name in self.sparse_max]
+        list_cols = set(self.sparse_names)
+        group_handlers = []
+        for column_names in self.dtype_reverse_map.values():
+            scalars = [col for col in column_names if col not in list_cols]
+            lists = [col for col in column_names if col in list_cols]
+            if not lists:
+                handler = type(self)._group_scalars_only
+            elif not scalars:
+                handler = type(self)._group_lists_only
+            else:
+                handler = type(self)._group_mixed
+            group_handlers.append((column_names, scalars, lists, handler))
+        self._group_handlers = tuple(group_handlers)
+
         self._epochs = 1
 
         self.cat_names = dataset.schema.select_by_tag(Tags.CATEGORICAL).column_names
@@ -136,23 +225,8 @@ class LoaderBase:
         self._workers = None
 
         if transforms is not None:
-
-            if isinstance(transforms, List):
-                carry_node = Node(ColumnSelector("*"))
-                for transform in transforms:
-                    if not isinstance(transform, BaseOperator):
-                        raise TypeError(
-                            f"Detected invalid transform, {type(transform)},"
-                            "we only support operators based on the merlin core"
-                            "`BaseOperator`"
-                        )
-                    carry_node = carry_node >> transform
-                transform_graph = Graph(carry_node)
-            elif type(transforms, Graph):
-                transform_graph = transforms
-            self.transforms = transform_graph.construct_schema(self.schema).output_node
+            self.transforms, self.executor = _build_transform_graph(self.schema, transforms)
             self.schema = self.transforms.output_schema
-            self.executor = LocalExecutor()
         else:
             self.transforms = None
             self.executor = None
@@ -160,13 +234,17 @@ class LoaderBase:
     @property
     def _buff(self):
         if self.__buff is None:
-            # we set size of chunk queue to 1 we only want one chunk in queue at a time.
+            # each worker may keep up to `prefetch_factor` chunks in the queue
             self.__buff = ChunkQueue(
                 self,
-                1,
+                self.prefetch_factor * self.num_workers,
                 num_parts=self.parts_per_chunk,
+                num_workers=self.num_workers,
                 shuffle=self.shuffle,
                 epochs=self._epochs,
+                # with room for more than one chunk per worker, also read
+                # and shuffle the next chunk while converting the current one
+                stage_chunks=self.prefetch_factor > 1,
             )
         return self.__buff
 
@@ -225,7 +303,7 @@ class LoaderBase:
                 t.join()
             # remove joined threads from list
             self._workers = None
-            self._buff.q_out.queue.clear()
+            self._buff.q_out.clear()
         self._batch_itr = None
 
     def _indices_for_process(self):
@@ -246,15 +324,15 @@ class LoaderBase:
         generate_local_seed(self.global_rank, self.global_size)
         if self.seed_fn:
             new_seed = self.seed_fn()
-            cp.random.seed(new_seed)
-        cp.random.shuffle(self.indices)
+            self.indices = np.random.default_rng(new_seed).permutation(self.indices)
+        else:
+            np.random.shuffle(self.indices)
         generate_local_seed(self.global_rank, self.global_size)
 
     def __iter__(self):
         self.stop()
         self.num_rows_processed = 0
-        if self._buff.stopped:
-            self._buff.start()
+        self._buff.start()
 
         # shuffle partition indices to bring disparate
         # parts of the dataset "close" to one another
@@ -262,19 +340,21 @@ class LoaderBase:
             self._shuffle_indices()
 
         # build and start new threads for loading and
-        # concatenating data
+        # concatenating data, one per shard of partitions
         self._workers = []
-        t = threading.Thread(target=self._buff.load_chunks, args=(self.device,))
-        t.daemon = True
-        t.start()
-        self._workers.append(t)
+        for itr in self._buff.itrs:
+            t = threading.Thread(target=self._buff.load_chunks, args=(self.device, itr))
+            t.daemon = True
+            t.start()
+            self._workers.append(t)
         return self
 
     def __next__(self):
         return self._get_next_batch()
 
-    def _data_iter(self, epochs):
-        indices = self._indices_for_process()
+    def _data_iter(self, epochs, indices=None):
+        if indices is None:
+            indices = self._indices_for_process()
         return self.dataset.to_iter(
             indices=indices, epochs=epochs, columns=self.dataset.schema.column_names
         )
@@ -284,6 +364,11 @@ class LoaderBase:
         if isinstance(chunks, Exception):
             self.stop()
             raise chunks
+        if chunks is _END_OF_EPOCH:
+            # every worker has finished, so there's nothing left to wait for
+            self._workers = None
+            self._batch_itr = None
+            raise StopIteration
         self._batch_itr = iter(chunks)
 
     def _get_next_batch(self):
@@ -310,15 +395,9 @@ class LoaderBase:
         try:
             batch = next(self._batch_itr)
         except StopIteration:
-            # anticipate any more chunks getting created
-            # if not, raise the StopIteration
-            if not self._working and self._buff.empty:
-                self._workers = None
-                self._batch_itr = None
-                raise
-
-            # otherwise get the next chunks and return
-            # the first batch
+            # the workers always close out an epoch with an end marker, so
+            # wait for either the next chunk or that marker (which raises
+            # the StopIteration)
             self._fetch_chunk()
             batch = next(self._batch_itr)
         # if batch[0] is empty but other exist
@@ -341,61 +420,67 @@ class LoaderBase:
 
         Returns
         -------
-        Dict[Tensors]
-            A dictionary of the column tensor representations.
+        List[Tuple[Dict[Tensors], Tensors]]
+            The `(X, labels)` pair of every batch in the chunk. These are all
+            built up front, so a chunk's dense conversions of sparse columns
+            and transform outputs are held in memory together, once for every
+            chunk waiting in the queue (up to `prefetch_factor * num_workers`).
 
         """
         split_idx = self._get_segment_lengths(len(gdf))
         # map from big chunk to framework-specific tensors
-        chunks, names = self._create_tensors(gdf)
+        chunks = self._create_tensors(gdf)
 
-        # if we have any offsets, calculate nnzs up front
         # will need to get offsets if list columns detected in schema
-
-        # if len(chunks) == 4:
-        lists_list = [
-            col_name
-            for col_name, col_schema in self.dataset.schema.column_schemas.items()
-            if col_schema.is_list
-        ]
-        if len(lists_list) > 0:
+        if self.sparse_names:
             offsets = chunks[-1]
-            if use_nnz:
-                nnzs = offsets[1:] - offsets[:-1]
             chunks = chunks[:-1]
 
         # split them into batches and map to the framework-specific output format
-        batches = [[] for _ in range(len(split_idx))]
+        n_batches = len(split_idx)
+        # include an extra 1 on the offsets so we know how long the very last element is
+        split_idx_plus1 = split_idx + (1,)
+        batches = [[] for _ in range(n_batches)]
         offset_idx = 0
         for chunk in chunks:
             lists = None
             if isinstance(chunk, tuple):
                 chunk, lists = chunk
 
-            if len(split_idx) > 1 and chunk is not None:
+            if n_batches > 1 and chunk is not None:
                 chunk = self._split_fn(chunk, split_idx)
             else:
                 chunk = [chunk for _ in split_idx]
 
             if lists is not None:
                 num_list_columns = len(lists)
+                # same for every batch, so build it once per chunk
+                offsets_split_idx = (1,) * num_list_columns
 
-                # grab the set of offsets and nnzs corresponding to
+                # grab the set of offsets corresponding to
                 # the list columns from this chunk
                 chunk_offsets = offsets[:, offset_idx : offset_idx + num_list_columns]
-                if use_nnz:
-                    chunk_nnzs = nnzs[:, offset_idx : offset_idx + num_list_columns]
                 offset_idx += num_list_columns
 
+                # read the offsets at every batch boundary back to the host at
+                # once, rather than syncing for each column of each batch
+                batch_bounds = self._tensor_tolist(chunk_offsets[:: self.batch_size])
+                if len(batch_bounds) < n_batches + 1:
+                    batch_bounds.append(self._tensor_tolist(chunk_offsets[-1]))
+
                 # split them into batches, including an extra 1 on the offsets
                 # so we know how long the very last element is
-                batch_offsets = self._split_fn(chunk_offsets, split_idx + [1])
-                if use_nnz and len(split_idx) > 1:
-                    batch_nnzs = self._split_fn(chunk_nnzs, split_idx)
-                elif use_nnz:
-                    batch_nnzs = [chunk_nnzs]
+                batch_offsets = self._split_fn(chunk_offsets, split_idx_plus1)
+                if use_nnz:
+                    # the nnzs of these columns, computed from their slice of the
+                    # offsets instead of for every list column up front
+                    chunk_nnzs = chunk_offsets[1:] - chunk_offsets[:-1]
+                    if n_batches > 1:
+                        batch_nnzs = self._split_fn(chunk_nnzs, split_idx)
+                    else:
+                        batch_nnzs = [chunk_nnzs]
                 else:
-                    batch_nnzs = [None] * (len(batch_offsets) - 1)
+                    batch_nnzs = [None] * n_batches
 
                 # group all these indices together and iterate through
                 # them in batches to grab the proper elements from each
@@ -405,34 +490,27 @@ class LoaderBase:
             for n, c in enumerate(chunk):
                 if isinstance(c, tuple):
                     c, off0s, off1s, _nnzs = c
-                    offsets_split_idx = [1 for _ in range(num_list_columns)]
                     off0s = self._split_fn(off0s, offsets_split_idx, axis=1)
                     off1s = self._split_fn(off1s, offsets_split_idx, axis=1)
                     if use_nnz:
                         _nnzs = self._split_fn(_nnzs, offsets_split_idx, axis=1)
 
+                    starts, stops = batch_bounds[n], batch_bounds[n + 1]
+
                     # TODO: does this need to be ordereddict?
                     batch_lists = {}
                     for k, (column_name, values) in enumerate(lists.items()):
-                        off0, off1 = off0s[k], off1s[k]
-                        if use_nnz:
-                            nnz = _nnzs[k]
-
-                        # need to grab scalars for TF case
-                        if len(off0.shape) == 1:
-                            start, stop = off0[0], off1[0]
-                        elif len(off0.shape) == 2:
-                            start, stop = off0[0, 0], off1[0, 0]
-                        else:
-                            print(off0, off1)
-                            raise ValueError
-                        value = values[int(start) : int(stop)]
-                        index = off0 - start if not use_nnz else nnz
+                        start, stop = starts[k], stops[k]
+                        value = values[start:stop]
+                        index = off0s[k] - start if not use_nnz else _nnzs[k]
                         batch_lists[column_name] = (value, index)
                     c = (c, batch_lists)
 
                 batches[n].append(c)
-        return (self._handle_tensors(batch, names) for batch in batches)
+
+        # build the final batches here, on the worker thread that called us,
+        # so the training loop only has to pop finished batches off the queue
+        return [self._handle_tensors(batch) for batch in batches]
 
     def _get_segment_lengths(self, num_samples):
         """
@@ -440,19 +518,41 @@ class LoaderBase:
         to <torch|tf>.split functions for breaking
         up into batches
         """
-        num_full_batches = _num_steps(num_samples, self.batch_size) - 1
-        idx = [self.batch_size for _ in range(num_full_batches)]
-        idx.append(num_samples - num_full_batches * self.batch_size)
-        return idx
+        return _segment_lengths(num_samples, self.batch_size)
 
     def _to_sparse_tensor(self, values_offset, column_name):
         """
         Create a sparse representation of the input tensor.
         values_offset is either a tensor or a tuple of tensor, offset.
         """
-        seq_limit = self.sparse_max[column_name]
         values, offsets, diff_offsets, num_rows = self._pull_values_offsets(values_offset)
         max_seq_len = self._get_max_seq_len(diff_offsets)
+        return self._sparse_tensor_from_parts(
+            column_name, values, offsets, diff_offsets, num_rows, max_seq_len
+        )
+
+    def _to_sparse_tensors(self, X, column_names):
+        """
+        Replaces several columns of `X` with their sparse representations,
+        reading the longest sequence of every column back in a single call
+        instead of once per column.
+        """
+        pulled = [self._pull_values_offsets(X[column_name]) for column_name in column_names]
+        max_seq_lens = self._get_max_seq_lens([diff_offsets for _, _, diff_offsets, _ in pulled])
+        for column_name, parts, max_seq_len in zip(column_names, pulled, max_seq_lens):
+            X[column_name] = self._sparse_tensor_from_parts(column_name, *parts, max_seq_len)
+
+    def _get_max_seq_lens(self, diff_offsets_list):
+        """
+        Returns the longest sequence of each of several list columns.
+        Frameworks can override this to reduce them all in one go.
+        """
+        return [self._get_max_seq_len(diff_offsets) for diff_offsets in diff_offsets_list]
+
+    def _sparse_tensor_from_parts(
+        self, column_name, values, offsets, diff_offsets, num_rows, max_seq_len
+    ):
+        seq_limit = self.sparse_max[column_name]
         if max_seq_len > seq_limit:
             raise ValueError(
                 "The default sequence length has been configured "
@@ -490,14 +590,12 @@ class LoaderBase:
     def _split_fn(self, tensor, idx, axis=0):
         raise NotImplementedError
 
-    def _separate_list_columns(self, gdf):
-        lists, scalars = [], []
-        for col in gdf.columns:
-            if is_list_dtype(gdf[col]):
-                lists.append(col)
-            else:
-                scalars.append(col)
-        return scalars, lists
+    def _tensor_tolist(self, tensor):
+        """
+        Copies a tensor back to the host as a (nested) list
+        of Python scalars.
+        """
+        return tensor.tolist()
 
     @annotate("_create_tensors", color="darkgreen", domain="merlin_loader")
     def _create_tensors(self, gdf):
@@ -507,76 +605,78 @@ class LoaderBase:
         Can be overrideen
         """
         tensors = []
-        tensor_names = []
-        offsets = make_df(device=self.device)
-        for column_names in self.dtype_reverse_map.values():
-            # for column names using schema find scalars and lists columns
-            if len(column_names) == 0:
-                tensors.append(None)
-                continue
-
-            gdf_i = gdf[column_names]
-            gdf.drop(columns=column_names, inplace=True)
-
-            scalars, lists = self._separate_list_columns(gdf_i)
-
-            x = None
-            if scalars:
-                # split out cols and change all scalars
-                # should always return dict column_name: values, offsets (optional)
-                x = self._to_tensor(gdf_i[scalars])
-            if lists:
-                # split out lists
-                list_tensors = OrderedDict()
-                for column_name in lists:
-                    column = gdf_i.pop(column_name)
-                    leaves, col_offsets = pull_apart_list(column, device=self.device)
-
-                    if isinstance(leaves[0], list):
-                        leaves, nest_offsets = pull_apart_list(leaves, device=self.device)
-                        col_offsets = nest_offsets.iloc[col_offsets[:]]
-
-                    offsets[column_name] = col_offsets.reset_index(drop=True)
-                    list_tensors[column_name] = self._to_tensor(leaves)
-                x = x, list_tensors
-            tensors.append(x)
-            tensor_names.append(column_names)
-
-        if not offsets.empty:
+        # offsets of every list column, gathered up and framed in one go
+        offset_cols = OrderedDict()
+        # project every dtype group out of the chunk in one pass rather than
+        # dropping each group's columns from it in turn
+        gdf_groups = [gdf[column_names] for column_names, *_ in self._group_handlers]
+        del gdf
+        for (_, scalars, lists, handler), gdf_i in zip(self._group_handlers, gdf_groups):
+            tensors.append(handler(self, gdf_i, scalars, lists, offset_cols))
+
+        if offset_cols:
+            offsets = make_df(offset_cols, device=self.device)
             offsets_tensor = self._to_tensor(offsets)
             if len(offsets_tensor.shape) == 1:
                 offsets_tensor = offsets_tensor[:, None]
             tensors.append(offsets_tensor)
-        del gdf, offsets
+            del offsets
+        del gdf_groups, offset_cols
+
+        return tensors
+
+    def _group_scalars_only(self, gdf, scalars, lists, offset_cols):
+        return self._to_tensor(gdf)
 
-        return tensors, tensor_names
+    def _group_lists_only(self, gdf, scalars, lists, offset_cols):
+        return None, self._list_tensors(gdf, lists, offset_cols)
+
+    def _group_mixed(self, gdf, scalars, lists, offset_cols):
+        return self._to_tensor(gdf[scalars]), self._list_tensors(gdf, lists, offset_cols)
+
+    def _list_tensors(self, gdf, lists, offset_cols):
+        """
+        Converts the list columns of a dtype group to tensors, recording
+        the offsets of each column in `offset_cols`.
+        """
+        list_tensors = OrderedDict()
+        for column_name in lists:
+            leaves, col_offsets = self._pull_apart_list(gdf[column_name])
+            offset_cols[column_name] = col_offsets.values
+            list_tensors[column_name] = self._to_tensor(leaves)
+        return list_tensors
+
+    def _pull_apart_list(self, column):
+        """
+        Splits a list column into its leaf values and row offsets,
+        flattening one level of nesting if present.
+        """
+        leaves, col_offsets = pull_apart_list(column, device=self.device)
+        if isinstance(leaves[0], list):
+            leaves, nest_offsets = pull_apart_list(leaves, device=self.device)
+            col_offsets = nest_offsets.iloc[col_offsets[:]]
+        return leaves, col_offsets
 
     @annotate("_handle_tensors", color="darkgreen", domain="merlin_loader")
-    def _handle_tensors(self, tensors, tensor_names):
-        # tensors =  dictionary of all tensors
+    def _handle_tensors(self, tensors):
+        # tensors = one entry per dtype group, in the order of _group_handlers
         X = {}
-        for idx, (tensor, names) in enumerate(zip(tensors, tensor_names)):
-            lists = {}
-            if isinstance(tensor, tuple):
-                tensor, lists = tensor
-
-            names = [i for i in names if i not in lists]
+        for tensor, (_, scalars, lists, _) in zip(tensors, self._group_handlers):
+            if lists:
+                tensor, list_tensors = tensor
+                X.update(list_tensors)
 
             # now add in any scalar tensors
-            if len(names) > 1:
-                tensors = self._tensor_split(tensor, len(names), axis=1)
-                # pull out label tensor from here
-                lists.update(zip(names, tensors))
-            elif len(names) == 1:
-                lists[names[0]] = tensor
-            X.update(lists)
-
-        for column_name in self.sparse_names:
-            if column_name in self.sparse_max:
-                # raise ValueError(
-                #     f"Did not convert {column_name} to sparse due to missing sparse_max entry"
-                # )
-                X[column_name] = self._to_sparse_tensor(X[column_name], column_name)
+            if len(scalars) == 1:
+                X[scalars[0]] = tensor
+            elif len(scalars) > 1:
+                X.update(zip(scalars, self._tensor_split(tensor, len(scalars), axis=1)))
+
+        sparse_names = self._sparse_tensor_names
+        if len(sparse_names) == 1:
+            X[sparse_names[0]] = self._to_sparse_tensor(X[sparse_names[0]], sparse_names[0])
+        elif sparse_names:
+            self._to_sparse_tensors(X, sparse_names)
 
         # TODO: use dict for labels as well?
         # would require output layers to match naming
@@ -604,6 +704,69 @@ class LoaderBase:
         return gdf.toDlpack()
 
 
+class BoundedRingQueue:
+    """Fixed-size FIFO buffer shared between the chunk loading threads and
+    the training loop.
+
+    Producers and the consumer block on condition variables instead of
+    polling, and a blocked producer gives up as soon as ``stop_event`` is set
+    and the buffer is cleared.
+
+    Parameters
+    ----------
+    maxsize : int
+        Number of slots in the ring.
+    stop_event : threading.Event
+        Event that aborts pending and future calls to `put`.
+    """
+
+    def __init__(self, maxsize, stop_event):
+        self.maxsize = maxsize
+        self._slots = [None] * maxsize
+        self._head = 0
+        self._size = 0
+        self._stop_event = stop_event
+        lock = threading.Lock()
+        self._not_empty = threading.Condition(lock)
+        self._not_full = threading.Condition(lock)
+
+    def empty(self):
+        with self._not_empty:
+            return self._size == 0
+
+    def put(self, item):
+        """Append `item`, waiting for a free slot. Returns False if stopped."""
+        with self._not_full:
+            while not self._stop_event.is_set() and self._size == self.maxsize:
+                self._not_full.wait()
+            if self._stop_event.is_set():
+                return False
+            self._slots[(self._head + self._size) % self.maxsize] = item
+            self._size += 1
+            self._not_empty.notify()
+            return True
+
+    def get(self):
+        """Remove and return the oldest item, waiting until one is available."""
+        with self._not_empty:
+            while self._size == 0:
+                self._not_empty.wait()
+            item = self._slots[self._head]
+            self._slots[self._head] = None
+            self._head = (self._head + 1) % self.maxsize
+            self._size -= 1
+            self._not_full.notify()
+            return item
+
+    def clear(self):
+        """Drop every buffered item and wake up any blocked producers."""
+        with self._not_full:
+            self._slots = [None] * self.maxsize
+            self._head = 0
+            self._size = 0
+            self._not_full.notify_all()
+
+
 class ChunkQueue:
     """This class takes partitions (parts) from an merlin.io.Dataset
     and concatenates them into a cudf dataframe "chunk." This chunk
@@ -617,21 +780,47 @@ class ChunkQueue:
     num_parts : int
         Number of partitions from the iterator, a merlin.io.Dataset to
         concatenate into a "chunk."
+    num_workers : int
+        Number of threads loading chunks concurrently. Each one reads a
+        disjoint shard of the partitions assigned to this process.
     shuffle : bool
         Enable or disable chunk-level shuffling.
-    put_wait: float
-        Specifies the timeout to wait for a full queue to open up before checking
-        for errors and trying again.
+    stage_chunks : bool
+        Read, concatenate and shuffle the next chunk on a helper thread
+        while the current one is converted to tensors. Holds one extra
+        chunk in memory per worker.
     """
 
-    def __init__(self, dataloader, qsize, num_parts=1, shuffle=False, put_wait=1e-6, epochs=1):
+    def __init__(
+        self,
+        dataloader,
+        qsize,
+        num_parts=1,
+        num_workers=1,
+        shuffle=False,
+        epochs=1,
+        stage_chunks=False,
+    ):
         self.num_parts = num_parts
+        self.num_workers = num_workers
         self.shuffle = shuffle
-        self.put_wait = put_wait
-        self.q_out = queue.Queue(qsize)
+        self.stage_chunks = stage_chunks
         self._stop_event = threading.Event()
+        self.q_out = BoundedRingQueue(qsize, self._stop_event)
         self.itr = dataloader._data_iter(epochs)
+        if num_workers > 1:
+            indices = dataloader._indices_for_process()
+            self.itrs = [
+                dataloader._data_iter(epochs, indices=indices[i::num_workers])
+                for i in range(num_workers)
+                if indices[i::num_workers]
+            ]
+        else:
+            self.itrs = [self.itr]
         self.dataloader = dataloader
+        self._spill_lock = threading.Lock()
+        self._spills = []
+        self._running_workers = 0
 
     def __len__(self):
         return len(self.itr)
@@ -648,15 +837,8 @@ class ChunkQueue:
         return self.q_out.get()
 
     def put(self, packet):
-        while True:
-            if self.stopped:
-                return True
-
-            try:
-                self.q_out.put(packet, timeout=self.put_wait)
-                return False
-            except queue.Full:
-                continue
+        # returns True if the queue was stopped before the packet could be put
+        return not self.q_out.put(packet)
 
     @annotate("batch", color="darkgreen", domain="merlin_loader")
     def batch(self, itr):
@@ -679,37 +861,111 @@ class ChunkQueue:
 
     @annotate("chunk_logic", color="darkgreen", domain="merlin_loader")
     def chunk_logic(self, itr):
-        spill = None
-        for chunks in self.batch(itr):
-            if self.stopped:
-                return
+        batches = self.batch(itr)
+        if self.stage_chunks:
+            spill = self._staged_chunk_logic(batches)
+        else:
+            spill = None
+            while not self.stopped:
+                chunks, spill = self._next_chunk(batches, spill)
+                if chunks is None:
+                    break
+                if self._put_tensors(chunks):
+                    return
+                chunks = None
+
+        if not self.stopped:
+            self._finish_worker(spill)
+
+    def _staged_chunk_logic(self, batches):
+        # two stage pipeline: a helper thread prepares the next chunk while
+        # this one builds tensors from the current chunk
+        with ThreadPoolExecutor(max_workers=1) as stager:
+            staged = stager.submit(self._next_chunk_on_device, batches, None)
+            while True:
+                chunks, spill = staged.result()
+                if chunks is None or self.stopped:
+                    return spill
+                staged = stager.submit(self._next_chunk_on_device, batches, spill)
+                if self._put_tensors(chunks):
+                    # skip the staged chunk if it hasn't started yet,
+                    # otherwise the pool waits for it on the way out
+                    staged.cancel()
+                    return spill
+                chunks = None
+
+    def _next_chunk_on_device(self, batches, spill):
+        dataloader = self.dataloader
+        if dataloader.device == "cpu":
+            return self._next_chunk(batches, spill)
+        # device contexts are per thread, so enter the worker's one here too
+        with dataloader._get_device_ctx(dataloader.device):
+            return self._next_chunk(batches, spill)
+
+    def _next_chunk(self, batches, spill):
+        """Reads the next group of partitions and turns them into a chunk
+        divisible by the batch size. Returns ``(None, spill)`` once the
+        partitions are exhausted.
+        """
+        try:
+            chunks = next(batches)
+        except StopIteration:
+            return None, spill
 
-            if spill is not None and not spill.empty:
-                chunks.insert(0, spill)
+        if spill is not None and not spill.empty:
+            chunks.insert(0, spill)
 
-            chunks = concat(chunks)
-            chunks.reset_index(drop=True, inplace=True)
-            chunks, spill = self.get_batch_div_chunk(chunks, self.dataloader.batch_size)
-            if self.shuffle:
-                chunks = shuffle_df(chunks)
+        chunks = concat(chunks)
+        chunks.reset_index(drop=True, inplace=True)
+        chunks, spill = self.get_batch_div_chunk(chunks, self.dataloader.batch_size)
+        if self.shuffle:
+            chunks = shuffle_df(chunks)
+        return chunks, spill
 
+    def _put_tensors(self, chunks):
+        if len(chunks) == 0:
+            return False
+        chunks = self.dataloader.make_tensors(chunks, self.dataloader._use_nnz)
+        # put returns True if buffer is stopped before
+        # packet can be put in queue. Keeps us from
+        # freezing on a put on a full queue
+        return self.put(chunks)
+
+    def _finish_worker(self, spill):
+        # The last worker to finish batches up the leftover rows of every
+        # worker, so only the final batch of the epoch can be short.
+        with self._spill_lock:
+            if spill is not None and not spill.empty:
+                self._spills.append(spill)
+            self._running_workers -= 1
+            if self._running_workers > 0:
+                return
+            spills, self._spills = self._spills, []
+
+        if spills:
+            self._put_spills(spills)
+        # always close out the epoch, even when there was nothing left over
+        # or it was dropped, so the training loop never waits on an empty queue
+        self.put(_END_OF_EPOCH)
+
+    def _put_spills(self, spills):
+        spill = spills[0] if len(spills) == 1 else concat(spills)
+        spill.reset_index(drop=True, inplace=True)
+        if len(spills) > 1:
+            chunks, spill = self.get_batch_div_chunk(spill, self.dataloader.batch_size)
             if len(chunks) > 0:
                 chunks = self.dataloader.make_tensors(chunks, self.dataloader._use_nnz)
-                # put returns True if buffer is stopped before
-                # packet can be put in queue. Keeps us from
-                # freezing on a put on a full queue
                 if self.put(chunks):
                     return
-            chunks = None
         # takes care final batch, which is less than batch size
-        if not self.dataloader.drop_last and spill is not None and not spill.empty:
+        if not self.dataloader.drop_last and not spill.empty:
             spill = self.dataloader.make_tensors(spill, self.dataloader._use_nnz)
             self.put(spill)
 
     @annotate("load_chunks", color="darkgreen", domain="merlin_loader")
-    def load_chunks(self, dev):
+    def load_chunks(self, dev, itr=None):
         try:
-            itr = iter(self.itr)
+            itr = iter(self.itr if itr is None else itr)
             if self.dataloader.device != "cpu":
                 with self.dataloader._get_device_ctx(dev):
                     self.chunk_logic(itr)
@@ -724,18 +980,19 @@ class ChunkQueue:
         # TODO: should we be clearing? I can imagine a world where
         # you want the thread to stop but still want to grab
         # data out of the buffer
-        self.q_out.queue.clear()
+        self.q_out.clear()
 
     def start(self):
         self._stop_event.clear()
+        with self._spill_lock:
+            self._spills = []
+            self._running_workers = len(self.itrs)
 
     def get_batch_div_chunk(self, chunks, batch_size):
         # TODO: is there a way to do this using cupy?
         spill_idx = int(chunks.shape[0] / batch_size) * batch_size
-        spill = make_df(chunks.iloc[spill_idx:])
-        chunks = make_df(chunks.iloc[:spill_idx])
-        if not chunks.empty:
-            chunks.reset_index(drop=True, inplace=True)
-        if not spill.empty:
-            spill.reset_index(drop=True, inplace=True)
+        # the slices are already frames of the same backend, so don't re-wrap
+        # them with make_df
+        spill = chunks.iloc[spill_idx:].reset_index(drop=True)
+        chunks = chunks.iloc[:spill_idx].reset_index(drop=True)
         return chunks, spill
@@ -96,6 +96,14 @@ class Loader(tf.keras.utils.Sequence, LoaderBase):
         Whether or not to drop the last batch in an epoch. This is useful when you need to
         guarantee that each batch contains exactly `batch_size` rows - since the last batch
         will usually contain fewer rows.
+    num_workers: int, default 1
+        Number of background threads loading chunks. Each thread reads a disjoint
+        subset of the partitions, so with more than one worker the order in which
+        chunks arrive is no longer deterministic.
+    prefetch_factor: int, default 1
+        Number of chunks each worker may keep ready ahead of the training loop.
+        Above 1, each worker also reads and shuffles its next chunk while
+        the current one is being converted to tensors.
     """
 
     _use_nnz = True
@@ -112,6 +120,8 @@ class Loader(tf.keras.utils.Sequence, LoaderBase):
         drop_last=False,
         transforms=None,
         device=None,
+        num_workers=1,
+        prefetch_factor=1,
     ):
         LoaderBase.__init__(
             self,
@@ -125,6 +135,8 @@ class Loader(tf.keras.utils.Sequence, LoaderBase):
             drop_last=drop_last,
             transforms=transforms,
             device=device,
+            num_workers=num_workers,
+            prefetch_factor=prefetch_factor,
         )
         self._map_fns = []
 
@@ -181,6 +193,9 @@ class Loader(tf.keras.utils.Sequence, LoaderBase):
         """
         return tf.split(tensor, idx, axis=axis)
 
+    def _tensor_tolist(self, tensor):
+        return tensor.numpy().tolist()
+
     @property
     def _LONG_DTYPE(self):
         return tf.int64
@@ -252,6 +267,10 @@ class Loader(tf.keras.utils.Sequence, LoaderBase):
         # get_max_seq_len, return int
         return int(tf.math.reduce_max(diff_offsets))
 
+    def _get_max_seq_lens(self, diff_offsets_list):
+        max_seq_lens = [tf.math.reduce_max(diff_offsets) for diff_offsets in diff_offsets_list]
+        return tf.stack(max_seq_lens).numpy().tolist()
+
     def _get_indices(self, offsets, diff_offsets):
         # Building the indices to reconstruct the sparse tensors
         row_ids = tf.range(len(offsets), dtype=tf.int64)
@@ -280,8 +299,8 @@ class Loader(tf.keras.utils.Sequence, LoaderBase):
             tensor = tf.sparse.to_dense(tensor)
         return tensor
 
-    def _handle_tensors(self, tensors, tensor_names):
-        to_return = super()._handle_tensors(tensors, tensor_names)
+    def _handle_tensors(self, tensors):
+        to_return = super()._handle_tensors(tensors)
 
         for map_fn in self._map_fns:
             to_return = map_fn(*to_return)
@@ -296,7 +315,19 @@ class Loader(tf.keras.utils.Sequence, LoaderBase):
 
 
 class KerasSequenceValidater(tf.keras.callbacks.Callback):
-    # TODO: document
+    """Keras callback that validates the model against a dataloader at the
+    end of every epoch.
+
+    The compiled metrics of the model are updated with every batch of
+    `dataloader`, and their results are added to the epoch logs with a
+    ``val_`` prefix.
+
+    Parameters
+    ----------
+    dataloader : Loader
+        Dataloader that yields the validation batches.
+    """
+
     _supports_tf_logs = True
 
     def __init__(self, dataloader):
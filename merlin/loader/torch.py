@@ -65,6 +65,14 @@ class Loader(torch.utils.data.IterableDataset, LoaderBase):
         Whether or not to drop the last batch in an epoch. This is useful when you need to
         guarantee that each batch contains exactly `batch_size` rows - since the last batch
         will usually contain fewer rows.
+    num_workers: int, default 1
+        Number of background threads loading chunks. Each thread reads a disjoint
+        subset of the partitions, so with more than one worker the order in which
+        chunks arrive is no longer deterministic.
+    prefetch_factor: int, default 1
+        Number of chunks each worker may keep ready ahead of the training loop.
+        Above 1, each worker also reads and shuffles its next chunk while
+        the current one is being converted to tensors.
     """
 
     def __init__(
@@ -79,6 +87,8 @@ class Loader(torch.utils.data.IterableDataset, LoaderBase):
         drop_last=False,
         transforms=None,
         device=None,
+        num_workers=1,
+        prefetch_factor=1,
     ):
         LoaderBase.__init__(
             self,
@@ -92,6 +102,8 @@ class Loader(torch.utils.data.IterableDataset, LoaderBase):
             drop_last=drop_last,
             transforms=transforms,
             device=device,
+            num_workers=num_workers,
+            prefetch_factor=prefetch_factor,
         )
 
     def __iter__(self):
@@ -144,6 +156,10 @@ class Loader(torch.utils.data.IterableDataset, LoaderBase):
     def _get_max_seq_len(self, diff_offsets):
         return int(diff_offsets.max())
 
+    def _get_max_seq_lens(self, diff_offsets_list):
+        max_seq_lens = [diff_offsets.max().long() for diff_offsets in diff_offsets_list]
+        return torch.stack(max_seq_lens).tolist()
+
     # Building the indices to reconstruct the sparse tensors
 
     def _get_indices(self, offsets, diff_offsets):
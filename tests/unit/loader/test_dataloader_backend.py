@@ -13,13 +13,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import threading
+
 import numpy as np
 import pytest
 from conftest import assert_eq
 
 from merlin.core.dispatch import concat, generate_local_seed, get_random_state, make_df
+from merlin.dag import BaseOperator, ColumnSelector, Graph, Node
 from merlin.io import Dataset
-from merlin.loader.loader_base import LoaderBase
+from merlin.loader.loader_base import BoundedRingQueue, LoaderBase
 
 
 @pytest.mark.parametrize("batch_size", [128])
@@ -126,3 +129,77 @@ def test_dataloader_epochs(dataset, batch_size, epochs):
         concat([df1 for i in range(epochs)]).reset_index(drop=True),
         df2.reset_index(drop=True),
     )
+
+
+@pytest.mark.parametrize("num_samples", [1, 127, 128, 129, 1000])
+def test_segment_lengths(dataset, num_samples):
+    batch_size = 128
+    data_loader = LoaderBase(dataset, batch_size=batch_size, shuffle=False)
+
+    split_idx = data_loader._get_segment_lengths(num_samples)
+
+    assert isinstance(split_idx, tuple)
+    assert sum(split_idx) == num_samples
+    assert all(length == batch_size for length in split_idx[:-1])
+    assert 0 < split_idx[-1] <= batch_size
+
+
+def test_dataloader_transforms_cached(dataset):
+    transforms = [BaseOperator()]
+
+    data_loader_0 = LoaderBase(dataset, batch_size=128, shuffle=False, transforms=transforms)
+    data_loader_1 = LoaderBase(dataset, batch_size=128, shuffle=False, transforms=transforms)
+
+    # the compiled graph is shared between loaders for the same schema
+    assert data_loader_0.transforms is data_loader_1.transforms
+    assert data_loader_0.schema == data_loader_1.schema
+
+
+def test_dataloader_transforms_graph(dataset):
+    graph = Graph(Node(ColumnSelector("*")) >> BaseOperator())
+    column_names = dataset.schema.column_names
+    subset = Dataset(dataset.to_ddf()[column_names[:2]])
+
+    # every loader gets its own build of the graph for its own schema, and
+    # building it for another schema later doesn't touch earlier loaders
+    data_loaders = []
+    for ds, expected in [(dataset, column_names), (subset, column_names[:2])] * 2:
+        data_loader = LoaderBase(ds, batch_size=128, shuffle=False, transforms=graph)
+        data_loaders.append((data_loader, expected))
+        for loader, loader_columns in data_loaders:
+            assert loader.schema.column_names == loader_columns
+            assert loader.transforms.output_schema.column_names == loader_columns
+
+
+def test_dataloader_invalid_transforms(dataset):
+    with pytest.raises(TypeError):
+        LoaderBase(dataset, batch_size=128, shuffle=False, transforms=[lambda x: x])
+
+    with pytest.raises(TypeError):
+        LoaderBase(dataset, batch_size=128, shuffle=False, transforms=BaseOperator())
+
+
+def test_bounded_ring_queue():
+    stop_event = threading.Event()
+    ring = BoundedRingQueue(2, stop_event)
+    assert ring.empty()
+
+    # items come out in the order they were put, across wrap-arounds
+    for i in range(5):
+        assert ring.put(i)
+        assert ring.get() == i
+    assert ring.empty()
+
+    # a producer blocked on a full ring gives up once the ring is stopped
+    assert ring.put("a")
+    assert ring.put("b")
+    results = []
+    producer = threading.Thread(target=lambda: results.append(ring.put("c")))
+    producer.start()
+    stop_event.set()
+    ring.clear()
+    producer.join(timeout=5)
+
+    assert not producer.is_alive()
+    assert results == [False]
+    assert ring.empty()
@@ -99,6 +99,56 @@ def test_torch_drp_reset(tmpdir, batch_size, drop_last, num_rows):
         assert num_rows == all_rows
 
 
+@pytest.mark.parametrize("num_workers", [1, 2, 3])
+@pytest.mark.parametrize("prefetch_factor", [1, 2])
+@pytest.mark.parametrize("shuffle", [False, True])
+@pytest.mark.parametrize("drop_last", [False, True])
+# 5 divides every partition evenly, so no worker has rows left over
+@pytest.mark.parametrize("batch_size", [5, 8])
+def test_torch_num_workers(tmpdir, num_workers, prefetch_factor, shuffle, drop_last, batch_size):
+    num_rows = 100
+    paths = []
+    for part in range(4):
+        df = make_df(
+            {
+                "id": np.arange(part * 25, (part + 1) * 25),
+                "label": np.zeros(25, dtype=np.int64),
+            }
+        )
+        path = os.path.join(tmpdir, f"dataset-{part}.parquet")
+        df.to_parquet(path)
+        paths.append(path)
+
+    ds = Dataset(paths, cpu=True)
+    ds.schema["label"] = ds.schema["label"].with_tags(Tags.TARGET)
+
+    dataloader = torch_dataloader.Loader(
+        ds,
+        batch_size=batch_size,
+        shuffle=shuffle,
+        drop_last=drop_last,
+        num_workers=num_workers,
+        prefetch_factor=prefetch_factor,
+    )
+
+    ids = []
+    batch_lengths = []
+    for X, _ in dataloader:
+        ids.extend(X["id"].cpu().numpy().flatten().tolist())
+        batch_lengths.append(len(X["id"]))
+
+    if drop_last:
+        assert len(ids) == num_rows // batch_size * batch_size
+        assert len(set(ids)) == len(ids)
+        assert set(ids) <= set(range(num_rows))
+        assert all(length == batch_size for length in batch_lengths)
+    else:
+        assert sorted(ids) == list(range(num_rows))
+        # only the final batch may be short, regardless of the number of workers
+        assert all(length == batch_size for length in batch_lengths[:-1])
+    assert len(batch_lengths) == len(dataloader)
+
+
 @pytest.mark.parametrize("batch", [0, 100, 1000])
 def test_gpu_file_iterator_ds(df, dataset, batch):
     df_itr = make_df({})
@@ -269,6 +319,35 @@ def test_mh_support(multihot_dataset):
     assert idx > 0
 
 
+def test_list_column_values():
+    num_rows = 23
+    batch_size = 5
+    # two ragged list columns sharing a dtype with a scalar column, plus one of another dtype
+    data = {
+        "id": list(range(num_rows)),
+        "a": [[i] * (i % 3 + 1) for i in range(num_rows)],
+        "b": [list(range(i, i + i % 4 + 1)) for i in range(num_rows)],
+        "c": [[i * 0.5] * (i % 2 + 1) for i in range(num_rows)],
+    }
+    ds = Dataset(make_df(data))
+
+    dataloader = torch_dataloader.Loader(ds, batch_size=batch_size, shuffle=False)
+
+    batch_lengths = []
+    for X, _ in dataloader:
+        ids = X["id"].cpu().numpy().flatten().tolist()
+        batch_lengths.append(len(ids))
+        for col in ["a", "b", "c"]:
+            values, offsets = X[col]
+            values = values.cpu().numpy().flatten()
+            bounds = offsets.cpu().numpy().flatten().tolist() + [len(values)]
+            rows = [values[start:stop].tolist() for start, stop in zip(bounds[:-1], bounds[1:])]
+            assert rows == [data[col][i] for i in ids]
+
+    # several full batches and a short final one
+    assert batch_lengths == [batch_size] * (num_rows // batch_size) + [num_rows % batch_size]
+
+
 @pytest.mark.parametrize("sparse_dense", [False, True])
 def test_sparse_tensors(sparse_dense):
     # create small dataset, add values to sparse_list